@@ -6,7 +6,7 @@ from flask import Flask, jsonify, request, send_from_directory, send_file
 from flask_cors import CORS
 import sqlite3
 from pathlib import Path
-from math import floor
+from math import floor, ceil, sqrt
 
 app = Flask(__name__)
 CORS(app)
@@ -15,6 +15,10 @@ CORS(app)
 BASE_DIR = Path(__file__).parent
 DB_PATH = BASE_DIR.parent / "database" / "taxi_data.db"
 
+# z-score for the 95% confidence intervals reported by ?approx=1 responses
+APPROX_CONFIDENCE = 0.95
+APPROX_Z = 1.96
+
 def get_connection():
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row  # rows behave like dicts
@@ -42,6 +46,81 @@ def row_to_dict(row):
                     pass
     return d
 
+def wants_approx():
+    """True when the caller asked for a sample-based estimate (?approx=1)."""
+    return request.args.get("approx", "0").lower() in ("1", "true", "yes")
+
+def fetch_sample_strata(conn, columns, start=None, end=None):
+    """
+    Read trips_sample rows in [start, end] grouped by their date x hour stratum.
+    Returns { (pickup_date, pickup_hour): {"size": N_h, "n": n_h, "rows": [...]} }
+    """
+    where_clauses = []
+    params = []
+    if start:
+        where_clauses.append("pickup_date >= DATE(?)")
+        params.append(start)
+    if end:
+        where_clauses.append("pickup_date <= DATE(?)")
+        params.append(end)
+    where_sql = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+
+    q = f"""
+      SELECT pickup_date, pickup_hour, stratum_size, sample_size, {", ".join(columns)}
+      FROM trips_sample
+      {where_sql}
+    """
+    strata = {}
+    for r in conn.execute(q, params).fetchall():
+        key = (r["pickup_date"], r["pickup_hour"])
+        if key not in strata:
+            strata[key] = {"size": r["stratum_size"], "n": r["sample_size"], "rows": []}
+        strata[key]["rows"].append(r)
+    return strata
+
+def stratified_total(strata, value):
+    """
+    Stratified estimate of a population total: sum over strata of N_h * mean_h.
+    value(row) gives the per-trip quantity (None rows are skipped).
+    Variance uses the usual finite-population-corrected formula
+        sum N_h^2 * (1 - n_h/N_h) * s_h^2 / n_h
+    Returns (estimate, variance).
+    """
+    estimate = 0.0
+    variance = 0.0
+    for stratum in strata.values():
+        values = [v for v in (value(r) for r in stratum["rows"]) if v is not None]
+        n = len(values)
+        if n == 0:
+            continue
+        size = stratum["size"]
+        mean = sum(values) / n
+        estimate += size * mean
+        if n > 1 and size > n:
+            s2 = sum((v - mean) ** 2 for v in values) / (n - 1)
+            variance += size * size * (1 - n / size) * s2 / n
+    return estimate, variance
+
+def stratified_mean(strata, value):
+    """
+    Estimate of the mean of value(row) over rows where it is not None, i.e. what
+    SQL AVG() returns: stratified total / stratified count of non-null rows.
+    Variance by linearisation of the ratio (residuals value - mean).
+    Returns (estimate, variance).
+    """
+    total, _ = stratified_total(strata, lambda r: value(r) if value(r) is not None else 0)
+    count, _ = stratified_total(strata, lambda r: 1 if value(r) is not None else 0)
+    if count == 0:
+        return 0.0, 0.0
+    mean = total / count
+    _, variance = stratified_total(strata, lambda r: value(r) - mean if value(r) is not None else 0)
+    return mean, variance / (count * count)
+
+def confidence_interval(estimate, variance):
+    """95% interval [low, high] around estimate, clipped at zero."""
+    half = APPROX_Z * sqrt(variance)
+    return [max(0.0, estimate - half), estimate + half]
+
 @app.route("/api/trips", methods=["GET"])
 def api_get_trips():
     """
@@ -134,9 +213,14 @@ def api_summary():
       total_revenue: float,
       trips_per_hour: [{hour: "00", count: 123}, ...]
     }
+    With ?approx=1 the figures are estimated from trips_sample and the response
+    also carries approximate: true, confidence, sample_size and
+    ci: {total_trips: [low, high], avg_distance_km: [...], ...}
     """
     start = request.args.get("start")
     end = request.args.get("end")
+    if wants_approx():
+        return api_summary_approx(start, end)
 
     where_clauses = []
     params = []
@@ -187,11 +271,50 @@ def api_summary():
     }
     return jsonify(resp)
 
+def api_summary_approx(start, end):
+    """Sample-based version of /api/summary with 95% confidence intervals."""
+    conn = get_connection()
+    strata = fetch_sample_strata(conn, ["distance_km", "duration_min", "fare_amount", "tip_amount"], start, end)
+    conn.close()
+
+    # date x hour strata are either fully inside or outside the date filter,
+    # so trip counts come out exact (zero variance); only the means/revenue are estimates
+    total, total_var = stratified_total(strata, lambda r: 1)
+    distance, distance_var = stratified_mean(strata, lambda r: r["distance_km"])
+    duration, duration_var = stratified_mean(strata, lambda r: r["duration_min"])
+    revenue, revenue_var = stratified_total(
+        strata, lambda r: (r["fare_amount"] or 0) + (r["tip_amount"] or 0))
+
+    hour_counts = {}
+    for (_, hour), stratum in strata.items():
+        hour_counts[hour] = hour_counts.get(hour, 0) + stratum["size"]
+    trips_per_hour = [{"hour": hour, "count": hour_counts[hour]} for hour in sorted(hour_counts)]
+
+    resp = {
+        "total_trips": int(round(total)),
+        "avg_distance_km": distance,
+        "avg_duration_min": duration,
+        "total_revenue": revenue,
+        "trips_per_hour": trips_per_hour,
+        "approximate": True,
+        "confidence": APPROX_CONFIDENCE,
+        "sample_size": sum(len(stratum["rows"]) for stratum in strata.values()),
+        "ci": {
+            "total_trips": confidence_interval(total, total_var),
+            "avg_distance_km": confidence_interval(distance, distance_var),
+            "avg_duration_min": confidence_interval(duration, duration_var),
+            "total_revenue": confidence_interval(revenue, revenue_var),
+        }
+    }
+    return jsonify(resp)
+
 @app.route("/api/heatmap", methods=["GET"])
 def api_heatmap():
     """
     /api/heatmap?start=&end=&grid_size=0.01
     Returns aggregated pickup counts per grid cell: [{lat, lng, count}, ...]
+    With ?approx=1 counts are estimated from trips_sample and each cell also
+    has count_low / count_high (95% confidence interval).
     """
     start = request.args.get("start")
     end = request.args.get("end")
@@ -199,8 +322,10 @@ def api_heatmap():
         grid_size = float(request.args.get("grid_size", 0.01))
     except:
         grid_size = 0.01
+    if wants_approx():
+        return api_heatmap_approx(start, end, grid_size)
 
-    where_clauses = []
+    where_clauses = ["pickup_lat IS NOT NULL", "pickup_lng IS NOT NULL"]
     params = []
     if start:
         where_clauses.append("DATE(pickup_datetime) >= DATE(?)")
@@ -208,23 +333,17 @@ def api_heatmap():
     if end:
         where_clauses.append("DATE(pickup_datetime) <= DATE(?)")
         params.append(end)
-    where_sql = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+    where_sql = "WHERE " + " AND ".join(where_clauses)
 
     conn = get_connection()
-    # fetch pickup coords only (limit to reasonable number for web demo)
+    # fetch pickup coords only; every matching trip is counted (no row cap),
+    # large ranges should use ?approx=1 for a fast first answer
     q = f"""
       SELECT pickup_lat, pickup_lng
       FROM trips
       {where_sql}
-      WHERE pickup_lat IS NOT NULL AND pickup_lng IS NOT NULL
-      LIMIT 50000
     """
-    try:
-        rows = conn.execute(q, params).fetchall()
-    except Exception:
-        # fallback if WHERE duplication occurs
-        q = f"SELECT pickup_lat, pickup_lng FROM trips WHERE pickup_lat IS NOT NULL AND pickup_lng IS NOT NULL LIMIT 50000"
-        rows = conn.execute(q).fetchall()
+    rows = conn.execute(q, params).fetchall()
     conn.close()
 
     # aggregate to grid cells (manual)
@@ -252,6 +371,48 @@ def api_heatmap():
     # We'll return all cells; frontend scales marker radius by count
     return jsonify(cells)
 
+def api_heatmap_approx(start, end, grid_size):
+    """Sample-based version of /api/heatmap with a 95% interval per cell."""
+    conn = get_connection()
+    strata = fetch_sample_strata(conn, ["pickup_lat", "pickup_lng"], start, end)
+    conn.close()
+
+    # per stratum, count sampled pickups in each cell; a cell's total is then a
+    # stratified estimate of an indicator (mean k/n, sample variance k(n-k)/(n(n-1)))
+    estimates = {}
+    variances = {}
+    for stratum in strata.values():
+        size = stratum["size"]
+        n = stratum["n"]
+        counts = {}
+        for r in stratum["rows"]:
+            try:
+                latf = float(r["pickup_lat"]); lngf = float(r["pickup_lng"])
+            except Exception:
+                continue
+            lat_idx = int(floor(latf / grid_size))
+            lng_idx = int(floor(lngf / grid_size))
+            key = f"{lat_idx}|{lng_idx}"
+            counts[key] = counts.get(key, 0) + 1
+        for key, k in counts.items():
+            estimates[key] = estimates.get(key, 0.0) + size * k / n
+            if n > 1 and size > n:
+                s2 = k * (n - k) / (n * (n - 1))
+                variances[key] = variances.get(key, 0.0) + size * size * (1 - n / size) * s2 / n
+
+    cells = []
+    for key, est in estimates.items():
+        lat_idx, lng_idx = key.split("|")
+        low, high = confidence_interval(est, variances.get(key, 0.0))
+        cells.append({
+            "lat": (int(lat_idx) + 0.5) * grid_size,
+            "lng": (int(lng_idx) + 0.5) * grid_size,
+            "count": int(round(est)),
+            "count_low": int(floor(low)),
+            "count_high": int(ceil(high)),
+        })
+    return jsonify(cells)
+
 # Manual top-N selection: returns top N grid cells from DB (server-side)
 @app.route("/api/top-zones", methods=["GET"])
 def api_top_zones():
@@ -1,4 +1,5 @@
 import requests
+from datetime import datetime, timedelta
 
 BASE_URL = "http://127.0.0.1:5000/api"
 
@@ -22,7 +23,52 @@ def test_heatmap_endpoint():
     data = resp.json()
     print("Heatmap endpoint OK, first cell:", data[0] if data else "No data")
 
+def date_filter(days=14):
+    """start/end covering `days` days from the first trip returned by /api/trips."""
+    first = requests.get(f"{BASE_URL}/trips?limit=1").json()["rows"][0]
+    start = datetime.fromisoformat(first["pickup_ts"][:10])
+    return {"start": start.date().isoformat(), "end": (start + timedelta(days=days)).date().isoformat()}
+
+def test_summary_approx_endpoint():
+    params = date_filter()
+    exact = requests.get(f"{BASE_URL}/summary", params=params).json()
+    resp = requests.get(f"{BASE_URL}/summary", params={**params, "approx": 1})
+    assert resp.status_code == 200
+    approx = resp.json()
+    assert approx["approximate"] is True
+    # strata are whole date x hour buckets, so counts are exact under a date filter
+    assert approx["total_trips"] == exact["total_trips"]
+    assert approx["trips_per_hour"] == exact["trips_per_hour"]
+    for key in ("avg_distance_km", "avg_duration_min"):
+        lo, hi = approx["ci"][key]
+        assert lo <= exact[key] <= hi, (key, exact[key], lo, hi)
+    print("Summary approx endpoint OK:", approx["total_trips"], approx["ci"])
+
+def test_heatmap_approx_endpoint():
+    params = {**date_filter(), "grid_size": 0.01}
+    exact = requests.get(f"{BASE_URL}/heatmap", params=params).json()
+    resp = requests.get(f"{BASE_URL}/heatmap", params={**params, "approx": 1})
+    assert resp.status_code == 200
+    approx = {(round(c["lat"], 6), round(c["lng"], 6)): c for c in resp.json()}
+
+    # cell estimates add up to the exact number of pickups in the range
+    exact_total = sum(c["count"] for c in exact)
+    approx_total = sum(c["count"] for c in approx.values())
+    assert abs(approx_total - exact_total) <= 0.01 * exact_total + len(approx)
+
+    # the busiest exact cells should (nearly all) fall inside their 95% intervals
+    busiest = sorted(exact, key=lambda c: c["count"], reverse=True)[:10]
+    covered = 0
+    for cell in busiest:
+        est = approx.get((round(cell["lat"], 6), round(cell["lng"], 6)))
+        if est and est["count_low"] <= cell["count"] <= est["count_high"]:
+            covered += 1
+    assert covered >= 0.8 * len(busiest), (covered, len(busiest))
+    print("Heatmap approx endpoint OK:", approx_total, "vs exact", exact_total)
+
 if __name__ == "__main__":
     test_trips_endpoint()
     test_summary_endpoint()
     test_heatmap_endpoint()
+    test_summary_approx_endpoint()
+    test_heatmap_approx_endpoint()
@@ -1,4 +1,5 @@
 import sqlite3
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -8,6 +9,12 @@ DB_PATH = BASE_DIR / "taxi_data.db"
 CSV_PATH = BASE_DIR.parent / "backend" / "data" / "clean_trips_features.csv"
 SCHEMA_PATH = BASE_DIR / "schema.sql"
 
+# Fraction of trips kept from every pickup date x hour stratum in trips_sample
+SAMPLE_FRACTION = 0.01
+# at least two trips per stratum so its variance (and the API's confidence intervals) can be estimated
+SAMPLE_MIN_PER_STRATUM = 2
+SAMPLE_SEED = 42
+
 def create_database():
     """Create the database and apply schema."""
     with sqlite3.connect(DB_PATH) as conn:
@@ -15,6 +22,35 @@ def create_database():
             conn.executescript(f.read())
     print("Database and schema created successfully.")
 
+def build_sample(trips_df, fraction=SAMPLE_FRACTION, seed=SAMPLE_SEED):
+    """Draw a stratified sample of trips: a fixed fraction of each pickup date x hour.
+
+    Every stratum keeps at least SAMPLE_MIN_PER_STRATUM trips (or all of them
+    if it is smaller). Each sampled row records the size of its stratum
+    (stratum_size) and how many trips were drawn from it (sample_size), so the
+    API can scale sample aggregates back up and compute confidence intervals.
+    """
+    df = trips_df[["trip_id", "pickup_lat", "pickup_lng", "distance_km",
+                   "duration_min", "fare_amount", "tip_amount"]].copy()
+    pickup = pd.to_datetime(trips_df["pickup_datetime"])
+    df["pickup_date"] = pickup.dt.strftime("%Y-%m-%d")
+    df["pickup_hour"] = pickup.dt.strftime("%H")
+
+    # shuffle once, then keep the first ceil(fraction * N) trips of each stratum
+    df = df.sample(frac=1, random_state=seed)
+    strata = df.groupby(["pickup_date", "pickup_hour"])
+    stratum_size = strata["trip_id"].transform("size")
+    sample_size = np.ceil(stratum_size * fraction).astype(int)
+    sample_size = np.maximum(sample_size, np.minimum(stratum_size, SAMPLE_MIN_PER_STRATUM))
+    keep = strata.cumcount() < sample_size
+
+    sample = df[keep].copy()
+    sample["stratum_size"] = stratum_size[keep]
+    sample["sample_size"] = sample_size[keep]
+    return sample[["trip_id", "pickup_date", "pickup_hour", "pickup_lat", "pickup_lng",
+                   "distance_km", "duration_min", "fare_amount", "tip_amount",
+                   "stratum_size", "sample_size"]]
+
 def load_data():
     """Load data from train.csv into the database."""
     import math
@@ -74,6 +110,12 @@ def load_data():
         })
         fares_df.to_sql("fares", conn, if_exists="replace", index=False)
 
+        # trips_sample table - stratified sample backing ?approx=1 queries;
+        # table and index come from schema.sql, so refill it rather than replace it
+        sample_df = build_sample(trips_df)
+        conn.execute("DELETE FROM trips_sample")
+        sample_df.to_sql("trips_sample", conn, if_exists="append", index=False)
+
     print("All data inserted successfully.")
 
 if __name__ == "__main__":
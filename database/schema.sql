@@ -37,5 +37,22 @@ CREATE TABLE fares (
     FOREIGN KEY (trip_id) REFERENCES trips(trip_id)
 );
 
+-- Stratified sample of trips (a fixed fraction per pickup date x hour), rebuilt at
+-- ingest and used by the ?approx=1 mode of the aggregate endpoints.
+CREATE TABLE trips_sample (
+    trip_id TEXT,
+    pickup_date TEXT,
+    pickup_hour TEXT,
+    pickup_lat REAL,
+    pickup_lng REAL,
+    distance_km REAL,
+    duration_min REAL,
+    fare_amount REAL,
+    tip_amount REAL,
+    stratum_size INTEGER,
+    sample_size INTEGER
+);
+
 CREATE INDEX idx_pickup_time ON trips (pickup_datetime);
 CREATE INDEX idx_pickup_location ON trips (pickup_latitude, pickup_longitude);
+CREATE INDEX idx_sample_date ON trips_sample (pickup_date);
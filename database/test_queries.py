@@ -10,12 +10,47 @@ def run_query(query):
         for row in rows:
             print(row)
 
-# Test basic queries
-print("Trips (first 5):")
-run_query("SELECT * FROM trips LIMIT 5;")
+def test_build_sample():
+    """Stratum sizes and per-stratum draws of the trips_sample builder."""
+    import math
+    import pandas as pd
+    from load_data import build_sample, SAMPLE_FRACTION, SAMPLE_MIN_PER_STRATUM
 
-print("\nFares (first 5):")
-run_query("SELECT * FROM fares LIMIT 5;")
+    # 2016-01-01 00h: 450 trips, 01h: 120 trips, 02h: 1 trip
+    times = (["2016-01-01 00:10:00"] * 450 + ["2016-01-01 01:20:00"] * 120
+             + ["2016-01-01 02:30:00"])
+    trips = pd.DataFrame({
+        "trip_id": [f"id{i}" for i in range(len(times))],
+        "pickup_datetime": times,
+        "pickup_lat": 40.75, "pickup_lng": -73.98,
+        "distance_km": 2.0, "duration_min": 10.0,
+        "fare_amount": None, "tip_amount": None,
+    })
+    sample = build_sample(trips)
 
-print("\nPassengers (first 5):")
-run_query("SELECT * FROM passengers LIMIT 5;")
+    assert sample["trip_id"].is_unique
+    assert set(sample["trip_id"]) <= set(trips["trip_id"])
+    for (date, hour), size in {("2016-01-01", "00"): 450, ("2016-01-01", "01"): 120,
+                               ("2016-01-01", "02"): 1}.items():
+        rows = sample[(sample["pickup_date"] == date) & (sample["pickup_hour"] == hour)]
+        expected = max(math.ceil(SAMPLE_FRACTION * size), min(size, SAMPLE_MIN_PER_STRATUM))
+        assert len(rows) == expected
+        assert (rows["stratum_size"] == size).all()
+        assert (rows["sample_size"] == expected).all()
+    print("build_sample OK:", len(sample), "rows")
+
+if __name__ == "__main__":
+    # Test basic queries
+    print("Trips (first 5):")
+    run_query("SELECT * FROM trips LIMIT 5;")
+
+    print("\nFares (first 5):")
+    run_query("SELECT * FROM fares LIMIT 5;")
+
+    print("\nPassengers (first 5):")
+    run_query("SELECT * FROM passengers LIMIT 5;")
+
+    print("\nTrips sample (first 5):")
+    run_query("SELECT * FROM trips_sample LIMIT 5;")
+
+    test_build_sample()
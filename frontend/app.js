@@ -19,6 +19,7 @@ function setupControls(){
   document.getElementById('prevPage').addEventListener('click', () => { if(currentPage>1){ currentPage--; loadTrips(); }});
   document.getElementById('nextPage').addEventListener('click', () => { currentPage++; loadTrips(); });
   document.getElementById('closeModal').addEventListener('click', () => toggleModal(false));
+  document.getElementById('exactMap').addEventListener('click', () => loadHeatmap(true));
   initMap();
 }
 
@@ -120,36 +121,67 @@ function getFilters(){
 }
 
 async function applyFilters(){
-  await Promise.all([loadSummary(), loadTimeSeries(), loadHeatmap(), loadTrips()]);
+  await Promise.all([loadSummary(), loadHeatmap(), loadTrips()]);
+}
+
+/* Progressive loading: ask for the sampled estimate (?approx=1) and, unless withExact
+   is false, the exact answer together; render the estimate as soon as it arrives and
+   replace it with the exact result. With withApprox false only the exact answer is
+   fetched. Responses from an older filter state are dropped. */
+const progressiveRequests = {};
+async function loadProgressive(endpoint, params, render, {withApprox = true, withExact = true} = {}){
+  const requestId = (progressiveRequests[endpoint] || 0) + 1;
+  progressiveRequests[endpoint] = requestId;
+  const isCurrent = () => progressiveRequests[endpoint] === requestId;
+  let exactShown = false;
+
+  const fetchJson = async (query) => {
+    const res = await fetch(`${BASE_URL}/${endpoint}?${new URLSearchParams(query).toString()}`);
+    return res.ok ? res.json() : null;
+  };
+
+  const approx = withApprox && fetchJson({...params, approx: 1}).then(data => {
+    if (data && !exactShown && isCurrent()) render(data);
+  }).catch(err => console.warn(`Approximate ${endpoint} failed:`, err));
+  const exact = withExact && fetchJson(params).then(data => {
+    if (data && isCurrent()) { exactShown = true; render(data); }
+  });
+  await Promise.all([approx, exact]);
 }
 
 /*Summary Cards*/
 async function loadSummary(){
   const f = getFilters();
-  const qs = new URLSearchParams({start: f.start, end: f.end}).toString();
-  const res = await fetch(`${BASE_URL}/summary?${qs}`);
-  if(!res.ok) return;
-  const data = await res.json();
+  await loadProgressive('summary', {start: f.start, end: f.end}, data => {
+    renderSummaryCards(data);
+    loadTimeSeries(data);
+  });
+}
+
+function renderSummaryCards(data){
+  const ci = data.approximate ? (data.ci || {}) : {};
+  // estimates get a badge and a ± half-width taken from the 95% confidence interval
+  const value = (key, digits, prefix = '') => {
+    const v = data[key] || 0;
+    if (!data.approximate) return `${prefix}${v.toFixed(digits)}`;
+    const half = ci[key] ? (ci[key][1] - ci[key][0]) / 2 : 0;
+    return half > 0 ? `≈ ${prefix}${v.toFixed(digits)} ± ${half.toFixed(digits)}` : `≈ ${prefix}${v.toFixed(digits)}`;
+  };
+  const badge = data.approximate ? '<span class="mini-badge">estimate</span>' : '';
   const container = document.getElementById('summaryCards');
   container.innerHTML = `
-    <div class="card"><strong>Total trips</strong><div>${data.total_trips ?? '—'}</div></div>
-    <div class="card"><strong>Avg distance (km)</strong><div>${(data.avg_distance_km||0).toFixed(2)}</div></div>
-    <div class="card"><strong>Avg duration (min)</strong><div>${(data.avg_duration_min||0).toFixed(1)}</div></div>
-    <div class="card"><strong>Revenue</strong><div>$${(data.total_revenue||0).toFixed(2)}</div></div>
+    <div class="card">${badge}<strong>Total trips</strong><div>${data.total_trips ?? '—'}</div></div>
+    <div class="card">${badge}<strong>Avg distance (km)</strong><div>${value('avg_distance_km', 2)}</div></div>
+    <div class="card">${badge}<strong>Avg duration (min)</strong><div>${value('avg_duration_min', 1)}</div></div>
+    <div class="card">${badge}<strong>Revenue</strong><div>${value('total_revenue', 2, '$')}</div></div>
   `;
 }
 
 /* Time Series / Fare Chart */
 let timeChart;
-async function loadTimeSeries(){
-  const f = getFilters();
-  const qs = new URLSearchParams({start: f.start, end: f.end}).toString();
-
-  // call summary endpoint (your backend currently returns trips_per_hour). 
+async function loadTimeSeries(data){
+  // data is the summary payload (your backend currently returns trips_per_hour).
   // prefer fares_per_hour if available; fall back to trips_per_hour.
-  const res = await fetch(`${BASE_URL}/summary?${qs}`);
-  if(!res.ok) return;
-  const data = await res.json();
 
   // Prefer fares_per_hour (expected shape: [{hour: '08:00', fare: 12}, ...])
   let labels = [];
@@ -246,17 +278,27 @@ function initMap(){
   markersLayer = L.layerGroup().addTo(map);
 }
 
-async function loadHeatmap(){
+// The map loads from the sample only: the exact heatmap scans every matching trip,
+// so it is fetched on demand via the "Exact counts" button (exact = true).
+async function loadHeatmap(exact = false){
   const f = getFilters();
-  const qs = new URLSearchParams({start: f.start, end: f.end, grid_size: 0.01}).toString();
-  const res = await fetch(`${BASE_URL}/heatmap?${qs}`);
-  if(!res.ok) return;
-  const data = await res.json();
+  await loadProgressive('heatmap', {start: f.start, end: f.end, grid_size: 0.01}, renderHeatmap,
+    {withApprox: !exact, withExact: exact});
+}
 
+function renderHeatmap(data){
   markersLayer.clearLayers();
 
+  // counts cover every trip in range (tens of thousands per busy cell on the full
+  // dataset), so radii are scaled against the busiest cell to stay between 50 and 500 m
+  let maxCount = 1;
+  data.forEach(cell => { if (cell.count > maxCount) maxCount = cell.count; });
+
   data.forEach(cell => {
-    const circle = L.circle([cell.lat, cell.lng], { radius: Math.max(50, cell.count*10), weight:0.5 }).bindPopup(`Trips: ${cell.count}`);
+    const label = cell.count_low !== undefined
+      ? `Trips: ≈ ${cell.count} (${cell.count_low}–${cell.count_high})`
+      : `Trips: ${cell.count}`;
+    const circle = L.circle([cell.lat, cell.lng], { radius: 50 + 450 * cell.count / maxCount, weight:0.5 }).bindPopup(label);
     markersLayer.addLayer(circle);
   });
 }